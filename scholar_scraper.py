@@ -1,106 +1,391 @@
 import os
+import csv
+import codecs
+import hashlib
+import sqlite3
+from contextlib import closing
 from dotenv import load_dotenv
-from serpapi import GoogleSearch
+import aiohttp
+import orjson
 import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # Optional; save_to_csv falls back to pandas
+    pa = None
 from datetime import datetime
 import time
+import asyncio
+import random
+import re
 import sys
+import warnings
+import logging
+import logging.handlers
+import queue
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+SERPAPI_URL = "https://serpapi.com/search.json"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "scholar_scraper")
+CACHE_TTL = 24 * 60 * 60  # seconds
+COLUMNS = ['title', 'authors', 'publication', 'year', 'cited_by', 'link']
+
+# Arrow schema for streamed pages, built once so no page pays for type inference
+SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('authors', pa.string()),
+    ('publication', pa.string()),
+    ('year', pa.string()),
+    ('cited_by', pa.int32()),
+    ('link', pa.string()),
+]) if pa is not None else None
+
+
+# Error message patterns, checked in order against the API "error" field
+_ERROR_PATTERNS = {
+    "rate_limit": re.compile(r"rate limit|too many requests", re.I),
+    "access_denied": re.compile(r"forbidden|unauthorized", re.I),
+    "captcha": re.compile(r"captcha|blocked", re.I),
+    "no_results": re.compile(r"no results|hasn't returned", re.I),
+}
+
+
+def _handle_rate_limit(error_msg, page_num):
+    """Rate limit exceeded (API limit reached)"""
+    logger.warning("\n".join([
+        f"\n{'='*50}",
+        "API RATE LIMIT EXCEEDED",
+        f"{'='*50}",
+        f"Error: {error_msg}",
+        "\nPossible reasons:",
+        "1. You've exceeded your hourly request limit",
+        "2. Your account has run out of searches",
+        "3. Too many requests in short time period",
+        "\nRecommendations:",
+        "- Check your SerpAPI dashboard for remaining credits",
+        "- Wait a few minutes before retrying",
+        "- Reduce the number of pages to scrape",
+        f"{'='*50}\n",
+    ]))
+    return False, "rate_limit"
+
+
+def _handle_access_denied(error_msg, page_num):
+    """Blocked/Forbidden access"""
+    logger.warning("\n".join([
+        f"\n{'='*50}",
+        "ACCESS DENIED",
+        f"{'='*50}",
+        f"Error: {error_msg}",
+        "\nPossible reasons:",
+        "1. Invalid API key",
+        "2. Account has been suspended",
+        "3. Permission denied for this resource",
+        "\nRecommendations:",
+        "- Verify your API key in .env file",
+        "- Check account status on SerpAPI dashboard",
+        f"{'='*50}\n",
+    ]))
+    return False, "access_denied"
+
+
+def _handle_captcha(error_msg, page_num):
+    """CAPTCHA or blocking issues"""
+    logger.warning("\n".join([
+        f"\nPage {page_num}: CAPTCHA/Blocking detected - {error_msg}",
+        "Note: SerpAPI usually handles CAPTCHAs automatically.",
+        "This might indicate a temporary issue.",
+    ]))
+    return True, "captcha"  # Continue with next page
+
+
+def _handle_no_results(error_msg, page_num):
+    """Empty results"""
+    logger.warning(f"\nPage {page_num}: No results found for this query")
+    return False, "no_results"
+
+
+_HANDLERS = {
+    "rate_limit": _handle_rate_limit,
+    "access_denied": _handle_access_denied,
+    "captcha": _handle_captcha,
+    "no_results": _handle_no_results,
+}
+
+
+def _join_authors(authors_list):
+    """Join an article's author entries into one display string"""
+    if not isinstance(authors_list, list) or not authors_list:
+        return 'N/A'
+    
+    # Authors are almost always dicts with a name, so try that first
+    try:
+        return ', '.join(a['name'] for a in authors_list)
+    except (KeyError, TypeError):
+        return ', '.join(
+            a.get('name', 'Unknown') if isinstance(a, dict) else str(a)
+            for a in authors_list
+        )
+
+
+def _typed_results(df):
+    """
+    Cast result columns to compact dtypes
+    
+    cited_by becomes int32 and the low-cardinality year column a category,
+    so summary statistics run on native arrays instead of Python objects.
+    """
+    df['cited_by'] = pd.to_numeric(df['cited_by'], errors='coerce').fillna(0).astype('int32')
+    df['year'] = df['year'].astype('category')
+    return df
+
+
+def _run(coro, loop_factory=None):
+    """Run a coroutine to completion, on a loop from loop_factory if given"""
+    if loop_factory is None:
+        return asyncio.run(coro)
+    
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+    
+    # asyncio.Runner is 3.11+; drive the factory's loop by hand on older versions
+    loop = loop_factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+class CsvPageWriter:
+    """Append result pages to a CSV file, flushing after every page"""
+    
+    def __init__(self, filename):
+        """
+        Args:
+            filename: CSV path, written as UTF-8 with a BOM
+        """
+        if pa is not None:
+            self._file = open(filename, 'wb')
+            self._file.write(codecs.BOM_UTF8)
+            self._writer = pa_csv.CSVWriter(self._file, SCHEMA)
+        else:
+            self._file = open(filename, 'w', newline='', encoding='utf-8-sig')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(COLUMNS)
+    
+    def write_page(self, page):
+        """Write one page of column lists keyed by COLUMNS"""
+        if pa is not None:
+            self._writer.write_table(pa.Table.from_pydict(page, schema=SCHEMA))
+        else:
+            self._writer.writerows(zip(*(page[column] for column in COLUMNS)))
+        self._file.flush()
+    
+    def close(self):
+        try:
+            if pa is not None:
+                self._writer.close()
+        finally:
+            self._file.close()
+
+
+class AsyncTokenBucket:
+    """Token bucket that paces concurrent requests to a fixed rate"""
+    
+    def __init__(self, capacity, refill_rate):
+        """
+        Args:
+            capacity: Maximum number of requests allowed in a burst
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = None
+        self._loop = None
+    
+    def _get_lock(self):
+        # Each asyncio.run() starts a new loop, and a lock can't be shared across loops
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+    
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._get_lock():
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class ResponseCache:
+    """SQLite-backed LRU cache of SerpAPI responses with a time-to-live"""
+    
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL, max_size=1000):
+        """
+        Args:
+            cache_dir: Directory holding the cache database
+            ttl: Seconds a cached response stays fresh
+            max_size: Maximum number of cached responses
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "responses.sqlite3")
+        self.ttl = ttl
+        self.max_size = max_size
+        
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, results BLOB NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+    
+    def _connect(self):
+        # One short-lived connection per call, so worker threads never share one
+        return closing(sqlite3.connect(self.path))
+    
+    @staticmethod
+    def make_key(query, start, num):
+        """Build a cache key, ignoring query case"""
+        return hashlib.sha256(f"{query.lower()}|{start}|{num}".encode()).hexdigest()
+    
+    def get(self, key, allow_stale=False):
+        """
+        Look up a cached response
+        
+        Args:
+            key: Key from make_key
+            allow_stale: Return the entry even if its TTL has expired
+            
+        Returns:
+            dict or None
+        """
+        with self._connect() as conn, conn:
+            row = conn.execute(
+                "SELECT results, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            results, stored_at = row
+            if not allow_stale and time.time() - stored_at >= self.ttl:
+                return None
+            
+            # Mark as most recently used
+            conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            return orjson.loads(results)
+    
+    def set(self, key, results):
+        """Store a response and evict the least recently used overflow"""
+        now = time.time()
+        
+        # Deleted rows free their pages for reuse, so the file stays bounded by max_size
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, results, stored_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, orjson.dumps(results), now, now),
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)",
+                (self.max_size,),
+            )
+
 
 class GoogleScholarScraperSerpAPI:
-    def __init__(self, api_key):
+    def __init__(self, api_key, refill_rate=10 / 60, burst_size=10, cache_dir=CACHE_DIR):
+        """
+        Args:
+            api_key: SerpAPI key
+            refill_rate: Sustained request rate in requests per second
+                (default 10 per minute; tune to your SerpAPI plan)
+            burst_size: Number of requests that may be sent back to back
+            cache_dir: Directory for cached responses, or None to disable caching
+        """
         if not api_key:
             raise ValueError("API key is required")
         self.api_key = api_key
-        self.results = []
+        # Column-oriented result buffer, one list per output column
+        self._cols = {column: [] for column in COLUMNS}
+        # Hashes of (title, link) already collected, to drop overlapping pages
+        self._seen = set()
+        self.bucket = AsyncTokenBucket(capacity=burst_size, refill_rate=refill_rate)
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
         self.max_retries = 3
-        self.retry_delay = 5  # seconds
+        self.retry_delay = 2  # seconds, fixed delay for non-transient errors
+        self.max_backoff = 60  # seconds, cap for exponential backoff
     
-    def handle_api_error(self, results, page_num):
+    def handle_api_error(self, results, page_num, http_status=None):
         """
         Handle various API errors and return appropriate messages
         
         Args:
             results: API response dictionary
             page_num: Current page number
+            http_status: HTTP status code of the response, if known
             
         Returns:
-            tuple: (continue_scraping: bool, error_message: str)
+            tuple: (continue_scraping: bool, error_message: str, http_status: int)
         """
+        # Server-side failures are transient; retry them with backoff
+        if http_status is not None and http_status >= 500:
+            logger.warning(f"\nPage {page_num}: Server error (HTTP {http_status})")
+            return True, "server_error", http_status
+        
+        # HTTP 429 is a rate limit whatever the body says, or even without one
+        if http_status == 429:
+            error_msg = results.get("error", "Too many requests")
+            return (*_HANDLERS["rate_limit"](error_msg, page_num), http_status)
+        
         # Check for HTTP-level errors
         if "error" in results:
             error_msg = results.get("error", "Unknown error")
             
-            # Rate limit exceeded (API limit reached)
-            if "rate limit" in error_msg.lower() or "too many requests" in error_msg.lower():
-                print(f"\n{'='*50}")
-                print("API RATE LIMIT EXCEEDED")
-                print(f"{'='*50}")
-                print(f"Error: {error_msg}")
-                print("\nPossible reasons:")
-                print("1. You've exceeded your hourly request limit")
-                print("2. Your account has run out of searches")
-                print("3. Too many requests in short time period")
-                print("\nRecommendations:")
-                print("- Check your SerpAPI dashboard for remaining credits")
-                print("- Wait a few minutes before retrying")
-                print("- Reduce the number of pages to scrape")
-                print(f"{'='*50}\n")
-                return False, "rate_limit"
-            
-            # Blocked/Forbidden access
-            elif "forbidden" in error_msg.lower() or "unauthorized" in error_msg.lower():
-                print(f"\n{'='*50}")
-                print("ACCESS DENIED")
-                print(f"{'='*50}")
-                print(f"Error: {error_msg}")
-                print("\nPossible reasons:")
-                print("1. Invalid API key")
-                print("2. Account has been suspended")
-                print("3. Permission denied for this resource")
-                print("\nRecommendations:")
-                print("- Verify your API key in .env file")
-                print("- Check account status on SerpAPI dashboard")
-                print(f"{'='*50}\n")
-                return False, "access_denied"
-            
-            # CAPTCHA or blocking issues
-            elif "captcha" in error_msg.lower() or "blocked" in error_msg.lower():
-                print(f"\nPage {page_num}: CAPTCHA/Blocking detected - {error_msg}")
-                print("Note: SerpAPI usually handles CAPTCHAs automatically.")
-                print("This might indicate a temporary issue.")
-                return True, "captcha"  # Continue with next page
-            
-            # Empty results
-            elif "no results" in error_msg.lower() or "hasn't returned" in error_msg.lower():
-                print(f"\nPage {page_num}: No results found for this query")
-                return False, "no_results"
+            for kind, pattern in _ERROR_PATTERNS.items():
+                if pattern.search(error_msg):
+                    return (*_HANDLERS[kind](error_msg, page_num), http_status)
             
             # Generic error
-            else:
-                print(f"\nPage {page_num}: Error - {error_msg}")
-                return True, "generic_error"
+            logger.warning(f"\nPage {page_num}: Error - {error_msg}")
+            return True, "generic_error", http_status
         
         # Check search status
         search_metadata = results.get("search_metadata", {})
         status = search_metadata.get("status", "Unknown")
         
         if status == "Error":
-            print(f"\nPage {page_num}: Search processing error")
-            return True, "processing_error"
+            logger.warning(f"\nPage {page_num}: Search processing error")
+            return True, "processing_error", http_status
         
         # Check for empty results state
         search_info = results.get("search_information", {})
         results_state = search_info.get("organic_results_state", "")
         
         if "empty" in results_state.lower():
-            print(f"\nPage {page_num}: No organic results found")
-            return False, "empty_results"
+            logger.warning(f"\nPage {page_num}: No organic results found")
+            return False, "empty_results", http_status
         
-        return True, None
+        return True, None, http_status
     
     def safe_get_field(self, data, keys, default='N/A'):
         """
@@ -116,180 +401,549 @@ class GoogleScholarScraperSerpAPI:
         """
         try:
             if isinstance(keys, list):
+                # Index directly; a missing or non-dict level raises instead of
+                # allocating a throwaway {} per key
                 value = data
                 for key in keys:
-                    value = value.get(key, {})
+                    value = value[key]
                 return value if value else default
             else:
                 return data.get(keys, default)
         except (AttributeError, TypeError, KeyError):
             return default
     
-    def search_articles(self, query, num_pages=3, delay=1):
+    async def _fetch_page(self, session, query, page):
         """
-        Search Google Scholar articles with pagination and error handling
+        Fetch a single results page from SerpAPI
         
         Args:
-            query: Search query string (case-insensitive)
-            num_pages: Number of pages to scrape
-            delay: Delay between requests in seconds
+            session: Shared aiohttp client session
+            query: Search query string
+            page: Zero-based page index
+        
+        Returns:
+            tuple: (results: dict, http_status: int)
         """
-        self.results = []
+        start = page * 10
         
-        # Normalize query
-        query = query.strip()
+        if self.cache:
+            cache_key = self.cache.make_key(query, start, 10)
+            # Disk I/O runs in a worker thread to keep the event loop free
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                logger.info(f"Page {page + 1}: Loaded from cache")
+                return cached, 200
+        
+        await self.bucket.acquire()
+        
+        params = {
+            "engine": "google_scholar",
+            "q": query,
+            "api_key": self.api_key,
+            "start": start,
+            "num": 10
+        }
+        
+        async with session.get(SERPAPI_URL, params=params) as response:
+            http_status = response.status
+            body = await response.read()
+        
+        try:
+            results = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Gateway 429/5xx pages are often HTML; the status alone drives the retry
+            if http_status < 500 and http_status != 429:
+                raise
+            results = {}
+        
+        # Only cache clean responses
+        if self.cache and http_status == 200 and "error" not in results:
+            await asyncio.to_thread(self.cache.set, cache_key, results)
+        
+        return results, http_status
+    
+    def _backoff_delay(self, retry_count, error_type):
+        """
+        Compute the wait before the next retry
+        
+        Args:
+            retry_count: Number of attempts made so far
+            error_type: Error type reported for the last attempt
+            
+        Returns:
+            float: Delay in seconds
+        """
+        # Truncated exponential backoff with jitter for transient failures,
+        # so concurrently failing pages don't retry in lockstep
+        if error_type in ("rate_limit", "server_error", "connection_error"):
+            return min((2 ** retry_count) + random.random(), self.max_backoff)
+        
+        return self.retry_delay
+    
+    async def _fetch_page_with_retries(self, session, query, page, num_pages):
+        """
+        Fetch a page, retrying recoverable API and connection errors
+        
+        Args:
+            session: Shared aiohttp client session
+            query: Search query string
+            page: Zero-based page index
+            num_pages: Total number of pages being fetched
+        
+        Returns:
+            tuple: (results: dict or None, continue_scraping: bool, error_type: str)
+        """
+        retry_count = 0
+        error_type = None
+        
+        while retry_count < self.max_retries:
+            try:
+                logger.info(f"Fetching page {page + 1}/{num_pages}...")
+                results, http_status = await self._fetch_page(session, query, page)
+                
+                # Handle API errors
+                continue_scraping, error_type, http_status = self.handle_api_error(results, page + 1, http_status)
+                
+                # Serve a stale cached copy rather than burning retries on a rate limit
+                if error_type == "rate_limit" and self.cache:
+                    stale = await asyncio.to_thread(
+                        self.cache.get, self.cache.make_key(query, page * 10, 10), allow_stale=True
+                    )
+                    if stale is not None:
+                        logger.warning("\n".join([
+                            f"\n{'='*50}",
+                            f"WARNING: Page {page + 1} served from stale cache",
+                            f"{'='*50}",
+                            "SerpAPI is rate limiting requests, so cached results",
+                            "older than the cache TTL are used instead.",
+                            f"{'='*50}\n",
+                        ]))
+                        return stale, True, None
+                
+                # Rate limits are usually transient, so back off before giving up
+                retry_rate_limit = error_type == "rate_limit" and retry_count + 1 < self.max_retries
+                
+                if not continue_scraping and not retry_rate_limit:
+                    return results, False, error_type
+                
+                if error_type:
+                    retry_count += 1
+                    if retry_count < self.max_retries:
+                        wait_time = self._backoff_delay(retry_count, error_type)
+                        logger.warning(f"Page {page + 1}: Retrying in {wait_time:.1f} seconds... (Attempt {retry_count + 1}/{self.max_retries})")
+                        await asyncio.sleep(wait_time)
+                    continue
+                
+                return results, True, None
+            
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                logger.warning(f"\nConnection error on page {page + 1}")
+                error_type = "connection_error"
+                retry_count += 1
+                if retry_count < self.max_retries:
+                    wait_time = self._backoff_delay(retry_count, error_type)
+                    logger.warning(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+            
+            except Exception as e:
+                logger.error(f"\nUnexpected error on page {page + 1}: {str(e)}")
+                error_type = "unexpected_error"
+                retry_count += 1
+                if retry_count < self.max_retries:
+                    await asyncio.sleep(self.retry_delay)
+        
+        return None, True, error_type
+    
+    def _parse_articles(self, organic_results):
+        """
+        Convert SerpAPI organic results into result columns
+        
+        Args:
+            organic_results: List of article dictionaries from the API
+            
+        Returns:
+            tuple: (dict of one list per column in COLUMNS, list of dedupe keys),
+            both in article order
+        """
+        page = {column: [] for column in COLUMNS}
+        keys = []
+        
+        for article in organic_results:
+            # Hot-path fields are read inline to skip the helper call
+            raw_title = article.get('title')
+            raw_link = article.get('link')
+            title = raw_title or 'Untitled'
+            link = raw_link or 'No URL available'
+            year = str(article.get('year') or 'N/A')
+            publication = self.safe_get_field(article, ['publication_info', 'summary'], 'N/A')
+            
+            # Handle missing or malformed publication info
+            try:
+                authors = _join_authors(article['publication_info']['authors'])
+            except (KeyError, TypeError):
+                authors = 'N/A'
+            
+            # Citation count is a dict under inline_links whenever present
+            try:
+                cited_by = int(article['inline_links']['cited_by']['total'] or 0)
+            except (KeyError, TypeError, ValueError):
+                cited_by = 0
+            
+            page['title'].append(title)
+            page['authors'].append(authors)
+            page['publication'].append(publication)
+            page['year'].append(year)
+            page['cited_by'].append(cited_by)
+            page['link'].append(link)
+            # Key on the raw fields so placeholder-only articles never match each other
+            keys.append(hash((raw_title, raw_link)) if raw_title or raw_link else None)
         
-        print(f"\n{'='*50}")
-        print(f"Searching for: '{query}'")
-        print(f"Pages to fetch: {num_pages}")
-        print(f"{'='*50}\n")
+        return page, keys
+    
+    async def _launch_pages(self, session, query, num_pages, wrap=None):
+        """
+        Start page fetch tasks, skipping pages beyond the reported result count
+        
+        Page 1 is fetched first and its total_results caps how many more pages
+        are requested, so short result sets don't spend credits on empty pages.
+        
+        Args:
+            session: Shared aiohttp client session
+            query: Search query string
+            num_pages: Number of pages requested
+            wrap: Optional coroutine wrapper applied to every fetch (e.g. a semaphore)
+            
+        Returns:
+            list: Page fetch tasks, indexed by page
+        """
+        def start(page):
+            coro = self._fetch_page_with_retries(session, query, page, num_pages)
+            return asyncio.create_task(wrap(coro) if wrap else coro)
         
+        first = start(0)
+        try:
+            results, continue_scraping, _ = await first
+        except Exception:
+            # Reported when _collect_pages awaits the task
+            results, continue_scraping = None, True
+        
+        if not continue_scraping:
+            return [first]
+        
+        needed = num_pages
+        if results:
+            try:
+                total = int(results.get("search_information", {}).get("total_results", num_pages * 10))
+                needed = max(1, min(num_pages, -(-total // 10)))
+            except (TypeError, ValueError):
+                pass
+        
+        if needed < num_pages:
+            logger.info(f"Only {total} results reported; fetching {needed} of {num_pages} pages")
+        
+        return [first] + [start(page) for page in range(1, needed)]
+    
+    async def _collect_pages(self, tasks, writer=None):
+        """
+        Await page tasks in page order and store their articles
+        
+        Pages are parsed as soon as they (and every earlier page) arrive, so
+        parsing and disk writes overlap with the fetches still in flight.
+        
+        Args:
+            tasks: Page fetch tasks, indexed by page
+            writer: CsvPageWriter to stream pages to, or None to buffer them in self._cols
+            
+        Returns:
+            tuple: (articles received, duplicates included; articles stored)
+        """
         consecutive_errors = 0
         max_consecutive_errors = 3
+        total_articles = 0
+        stored_articles = 0
         
-        for page in range(num_pages):
-            retry_count = 0
-            page_success = False
-            
-            while retry_count < self.max_retries and not page_success:
+        try:
+            for page, task in enumerate(tasks):
                 try:
-                    start = page * 10
-                    
-                    params = {
-                        "engine": "google_scholar",
-                        "q": query,
-                        "api_key": self.api_key,
-                        "start": start,
-                        "num": 10
-                    }
-                    
-                    print(f"Fetching page {page + 1}/{num_pages}...", end=" ")
-                    search = GoogleSearch(params)
-                    results = search.get_dict()
-                    
-                    # Handle API errors
-                    continue_scraping, error_type = self.handle_api_error(results, page + 1)
-                    
-                    if not continue_scraping:
-                        print(f"\nStopping scraper due to: {error_type}")
-                        return pd.DataFrame(self.results) if self.results else pd.DataFrame()
-                    
-                    if error_type:
+                    results, continue_scraping, error_type = await task
+                except Exception as e:
+                    logger.error(f"\nUnexpected error on page {page + 1}: {str(e)}")
+                    results, continue_scraping, error_type = None, True, "unexpected_error"
+                
+                if not continue_scraping:
+                    logger.warning(f"\nStopping scraper due to: {error_type}")
+                    break
+                
+                if error_type:
+                    logger.warning(f"Failed to fetch page {page + 1} after {self.max_retries} attempts")
+                    consecutive_errors += 1
+                    if consecutive_errors >= max_consecutive_errors:
+                        logger.warning(f"\nToo many consecutive errors ({consecutive_errors}). Stopping.")
+                        break
+                    continue
+                
+                # Process organic results
+                if "organic_results" in results and results["organic_results"]:
+                    # A malformed article must not take down pages already collected
+                    try:
+                        batch, batch_keys = self._parse_articles(results["organic_results"])
+                        unique, keys = self._drop_seen(batch, batch_keys)
+                        
+                        if writer:
+                            writer.write_page(unique)
+                        else:
+                            for column in COLUMNS:
+                                self._cols[column].extend(unique[column])
+                    except Exception as e:
+                        logger.error(f"\nError processing page {page + 1}: {str(e)}")
                         consecutive_errors += 1
                         if consecutive_errors >= max_consecutive_errors:
-                            print(f"\nToo many consecutive errors ({consecutive_errors}). Stopping.")
-                            return pd.DataFrame(self.results) if self.results else pd.DataFrame()
-                        
-                        retry_count += 1
-                        if retry_count < self.max_retries:
-                            wait_time = self.retry_delay * retry_count
-                            print(f"Retrying in {wait_time} seconds... (Attempt {retry_count + 1}/{self.max_retries})")
-                            time.sleep(wait_time)
+                            logger.warning(f"\nToo many consecutive errors ({consecutive_errors}). Stopping.")
+                            break
                         continue
                     
-                    # Reset consecutive errors on success
+                    # Reset consecutive errors once the page is stored
                     consecutive_errors = 0
-                    
-                    # Process organic results
-                    if "organic_results" in results and results["organic_results"]:
-                        for article in results["organic_results"]:
-                            # Safe extraction of fields with fallbacks
-                            title = self.safe_get_field(article, 'title', 'Untitled')
-                            
-                            # Handle missing or malformed publication info
-                            pub_info = article.get('publication_info', {})
-                            authors_list = pub_info.get('authors', [])
-                            
-                            if isinstance(authors_list, list) and authors_list:
-                                authors = ', '.join([
-                                    a.get('name', 'Unknown') if isinstance(a, dict) else str(a)
-                                    for a in authors_list
-                                ])
-                            else:
-                                authors = 'N/A'
-                            
-                            # Safe extraction of citation count
-                            inline_links = article.get('inline_links', {})
-                            cited_by_info = inline_links.get('cited_by', {})
-                            cited_by = cited_by_info.get('total', 0) if isinstance(cited_by_info, dict) else 0
-                            
-                            # Handle missing link
-                            link = self.safe_get_field(article, 'link', 'No URL available')
-                            
-                            # Additional metadata
-                            publication = self.safe_get_field(pub_info, 'summary', 'N/A')
-                            year = self.safe_get_field(article, 'year', 'N/A')
-                            
-                            self.results.append({
-                                'title': title,
-                                'authors': authors,
-                                'publication': publication,
-                                'year': year,
-                                'cited_by': cited_by,
-                                'link': link
-                            })
-                        
-                        print(f"Success ({len(results['organic_results'])} articles)")
-                        page_success = True
-                    else:
-                        print("No organic results on this page")
-                        consecutive_errors += 1
-                    
-                    # Rate limiting between successful requests
-                    if page_success and page < num_pages - 1:
-                        time.sleep(delay)
-                    
-                except KeyError as e:
-                    print(f"\nData structure error on page {page + 1}: Missing key '{e}'")
-                    retry_count += 1
-                    if retry_count < self.max_retries:
-                        time.sleep(self.retry_delay)
-                
-                except ConnectionError:
-                    print(f"\nConnection error on page {page + 1}")
-                    retry_count += 1
-                    if retry_count < self.max_retries:
-                        wait_time = self.retry_delay * retry_count
-                        print(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                    self._seen.update(keys)
+                    total_articles += len(batch['title'])
+                    stored_articles += len(unique['title'])
+                    logger.info(f"Page {page + 1}: Success ({len(batch['title'])} articles)")
+                else:
+                    logger.warning(f"Page {page + 1}: No organic results on this page")
+                    consecutive_errors += 1
+        finally:
+            # Stop outstanding fetches (and their API credits) after an early stop
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return total_articles, stored_articles
+    
+    def _drop_seen(self, page, page_keys):
+        """
+        Drop articles already collected in this search
+        
+        Args:
+            page: Parsed page columns
+            page_keys: Dedupe key per article, None for articles with neither
+                title nor link; those can't be matched and are always kept
+            
+        Returns:
+            tuple: (page columns holding only articles whose (title, link) hasn't
+            been seen before, their keys to add to self._seen once they are stored)
+        """
+        keep = []
+        keys = set()
+        
+        for index, key in enumerate(page_keys):
+            if key is None:
+                keep.append(index)
+            elif key not in self._seen and key not in keys:
+                keys.add(key)
+                keep.append(index)
+        
+        # Most pages have no repeats; only rebuild the columns when something was dropped
+        if len(keep) < len(page['title']):
+            page = {column: [values[i] for i in keep] for column, values in page.items()}
+        
+        return page, keys
+    
+    def _reset_results(self):
+        """Clear the column buffers and seen set before a new search"""
+        for values in self._cols.values():
+            values.clear()
+        self._seen.clear()
+    
+    def _results_frame(self):
+        """Build one typed DataFrame straight from the column buffers"""
+        if not self._cols['title']:
+            return pd.DataFrame(columns=COLUMNS)
+        
+        return _typed_results(pd.DataFrame(self._cols, columns=COLUMNS))
+    
+    async def search_articles_async(self, query, num_pages=3, *, output_file=None):
+        """
+        Search Google Scholar articles, fetching all pages concurrently
+        
+        Args:
+            query: Search query string (case-insensitive)
+            num_pages: Number of pages to scrape
+            output_file: CSV path to stream rows into as pages arrive; when set,
+                rows are not kept in memory and the filename is returned
                 
-                except Exception as e:
-                    print(f"\nUnexpected error on page {page + 1}: {str(e)}")
-                    retry_count += 1
-                    if retry_count < self.max_retries:
-                        time.sleep(self.retry_delay)
+        Returns:
+            DataFrame of results, or the CSV filename (None if nothing was
+            collected) when output_file is given
+        """
+        self._reset_results()
+        
+        # Normalize query
+        query = query.strip()
+        
+        logger.info("\n".join([
+            f"\n{'='*50}",
+            f"Searching for: '{query}'",
+            f"Pages to fetch: {num_pages}",
+            f"{'='*50}\n",
+        ]))
+        
+        writer = CsvPageWriter(output_file) if output_file else None
+        
+        try:
+            # One session for every page so the TCP/TLS connection pool is reused
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10)) as session:
+                tasks = await self._launch_pages(session, query, num_pages)
+                total_articles, unique_articles = await self._collect_pages(tasks, writer)
+        finally:
+            if writer:
+                writer.close()
+        
+        logger.info("\n".join([
+            f"\n{'='*50}",
+            f"Scraping completed!",
+            f"Total articles collected: {unique_articles}",
+            f"Duplicates skipped: {total_articles - unique_articles}",
+            f"{'='*50}\n",
+        ]))
+        
+        if output_file:
+            if not unique_articles:
+                os.remove(output_file)
+                return None
+            return output_file
+        
+        return self._results_frame()
+    
+    def search_articles(self, query, num_pages=3, delay=None, *, output_file=None, loop_factory=None):
+        """
+        Search Google Scholar articles with pagination and error handling
+        
+        Synchronous wrapper around search_articles_async.
+        
+        Args:
+            query: Search query string (case-insensitive)
+            num_pages: Number of pages to scrape
+            delay: Deprecated and ignored; requests are paced by the token bucket
+            output_file: Optional CSV path to stream rows into
+            loop_factory: Optional event loop factory, e.g. uvloop.new_event_loop
+        """
+        if delay is not None:
+            warnings.warn(
+                "search_articles(delay=...) is ignored; pace requests with refill_rate instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+        
+        return _run(
+            self.search_articles_async(query, num_pages=num_pages, output_file=output_file),
+            loop_factory,
+        )
+    
+    async def search_articles_bulk_async(self, queries, num_pages=3, concurrency=10):
+        """
+        Search several queries over one shared connection pool and rate limiter
+        
+        Pages for every query are fetched concurrently, at most `concurrency`
+        at a time, so TCP/TLS setup is paid once for the whole batch.
+        
+        Args:
+            queries: Iterable of search query strings
+            num_pages: Number of pages to scrape per query
+            concurrency: Maximum number of page fetches in flight
+            
+        Returns:
+            dict: Query -> DataFrame of results
+        """
+        # Normalize queries, dropping duplicates but keeping order
+        queries = list(dict.fromkeys(query.strip() for query in queries))
+        semaphore = asyncio.Semaphore(concurrency)
+        frames = {}
+        
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+        
+        logger.info("\n".join([
+            f"\n{'='*50}",
+            f"Bulk search: {len(queries)} queries",
+            f"Pages per query: {num_pages}",
+            f"{'='*50}\n",
+        ]))
+        
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+            launched = await asyncio.gather(*(
+                self._launch_pages(session, query, num_pages, wrap=limited)
+                for query in queries
+            ))
+            tasks = dict(zip(queries, launched))
             
-            # If page failed after all retries
-            if not page_success:
-                print(f"Failed to fetch page {page + 1} after {self.max_retries} attempts")
-                consecutive_errors += 1
+            # Everything is already in flight; collect one query at a time
+            # since the column buffers hold a single query's rows
+            for query, query_tasks in tasks.items():
+                self._reset_results()
+                total_articles, unique_articles = await self._collect_pages(query_tasks)
+                logger.info(f"'{query}': {unique_articles} articles collected "
+                            f"({total_articles - unique_articles} duplicates skipped)")
+                frames[query] = self._results_frame()
+        
+        return frames
+    
+    def search_articles_bulk(self, queries, num_pages=3, concurrency=10, *, loop_factory=None):
+        """
+        Search several queries sharing one connection pool
         
-        print(f"\n{'='*50}")
-        print(f"Scraping completed!")
-        print(f"Total articles collected: {len(self.results)}")
-        print(f"{'='*50}\n")
+        Synchronous wrapper around search_articles_bulk_async.
         
-        return pd.DataFrame(self.results) if self.results else pd.DataFrame()
+        Args:
+            queries: Iterable of search query strings
+            num_pages: Number of pages to scrape per query
+            concurrency: Maximum number of page fetches in flight
+            loop_factory: Optional event loop factory, e.g. uvloop.new_event_loop
+        """
+        return _run(
+            self.search_articles_bulk_async(queries, num_pages=num_pages, concurrency=concurrency),
+            loop_factory,
+        )
+    
+    @staticmethod
+    def default_filename():
+        """Timestamped CSV filename for a new run"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"scholar_results_{timestamp}.csv"
     
     def save_to_csv(self, df, filename=None):
         """Save results to CSV with timestamp"""
         if df.empty:
-            print("No data to save!")
+            logger.warning("No data to save!")
             return None
             
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"scholar_results_{timestamp}.csv"
+            filename = self.default_filename()
         
         try:
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
-            print(f"Results saved to {filename}")
+            written = False
+            if pa is not None:
+                # Arrow's C++ CSV writer is much faster on large string-heavy frames;
+                # the BOM is written by hand to match utf-8-sig
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    with open(filename, 'wb') as f:
+                        f.write(codecs.BOM_UTF8)
+                        pa_csv.write_csv(table, f)
+                    written = True
+                except pa.ArrowException:
+                    # e.g. mixed-type object columns Arrow can't convert
+                    pass
+            
+            if not written:
+                df.to_csv(filename, index=False, encoding='utf-8-sig')
+            logger.info(f"Results saved to {filename}")
             return filename
         except IOError as e:
-            print(f"Error saving file: {e}")
+            logger.error(f"Error saving file: {e}")
             return None
         except Exception as e:
-            print(f"Unexpected error while saving: {e}")
+            logger.error(f"Unexpected error while saving: {e}")
             return None
 
 
@@ -348,55 +1002,88 @@ if __name__ == "__main__":
         print("=" * 50)
         sys.exit(1)
     
+    # Use the libuv-based event loop where available; it isn't on Windows
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    # Records are queued and written to stdout by a background thread,
+    # so the event loop never blocks on terminal I/O
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    
     try:
         # Get user input
         search_query, pages = get_user_input()
         
         # Create scraper and search
         scraper = GoogleScholarScraperSerpAPI(API_KEY)
-        df = scraper.search_articles(search_query, num_pages=pages)
         
-        if not df.empty:
-            # Save results
-            scraper.save_to_csv(df)
+        # Rows are written to the CSV as each page arrives
+        output_file = scraper.search_articles(
+            search_query, num_pages=pages, output_file=scraper.default_filename(),
+            loop_factory=loop_factory,
+        )
+        
+        if output_file:
+            logger.info(f"Results saved to {output_file}")
+            # keep_default_na=False so literal 'N/A' placeholders stay strings
+            df = _typed_results(pd.read_csv(output_file, encoding='utf-8-sig', keep_default_na=False))
             
             # Display preview
-            print(f"\n{'=' * 50}")
-            print(f"Preview of results (first 5):")
-            print(f"{'=' * 50}\n")
+            logger.info("\n".join([
+                f"\n{'=' * 50}",
+                f"Preview of results (first 5):",
+                f"{'=' * 50}\n",
+            ]))
             
             # Display with better formatting
             pd.set_option('display.max_columns', None)
             pd.set_option('display.width', None)
             pd.set_option('display.max_colwidth', 50)
             
-            print(df.head().to_string(index=False))
+            logger.info(df.head().to_string(index=False))
             
             # Display statistics
-            print(f"\n{'=' * 50}")
-            print("Statistics:")
-            print(f"{'=' * 50}")
-            print(f"Total articles: {len(df)}")
-            print(f"Average citations: {df['cited_by'].mean():.2f}")
-            print(f"Most cited: {df['cited_by'].max()}")
-            print(f"Articles with missing authors: {(df['authors'] == 'N/A').sum()}")
-            print(f"{'=' * 50}\n")
+            logger.info("\n".join([
+                f"\n{'=' * 50}",
+                "Statistics:",
+                f"{'=' * 50}",
+                f"Total articles: {len(df)}",
+                f"Average citations: {df['cited_by'].mean():.2f}",
+                f"Most cited: {df['cited_by'].max()}",
+                f"Articles with missing authors: {(df['authors'] == 'N/A').sum()}",
+                f"{'=' * 50}\n",
+            ]))
         else:
-            print("\nNo results found or all requests failed!")
-            print("Please check:")
-            print("- Your search query")
-            print("- API key validity")
-            print("- Account credits on https://serpapi.com/dashboard")
+            logger.warning("\n".join([
+                "\nNo results found or all requests failed!",
+                "Please check:",
+                "- Your search query",
+                "- API key validity",
+                "- Account credits on https://serpapi.com/dashboard",
+            ]))
     
     except KeyboardInterrupt:
-        print("\n\nScraping interrupted by user!")
+        logger.warning("\n\nScraping interrupted by user!")
         sys.exit(0)
     
     except Exception as e:
-        print(f"\n{'=' * 50}")
-        print(f"FATAL ERROR")
-        print(f"{'=' * 50}")
-        print(f"Error: {str(e)}")
-        print("\nPlease report this error with the full traceback.")
-        print(f"{'=' * 50}\n")
+        logger.error("\n".join([
+            f"\n{'=' * 50}",
+            f"FATAL ERROR",
+            f"{'=' * 50}",
+            f"Error: {str(e)}",
+            "\nPlease report this error with the full traceback.",
+            f"{'=' * 50}\n",
+        ]))
         sys.exit(1)
+    
+    finally:
+        # Flush queued records before exiting
+        listener.stop()